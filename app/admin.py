@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db.models import Count
 from django.utils.html import format_html
 
 from .models import Country, State, Biome, Land
@@ -14,10 +15,14 @@ class BiomeAdmin(admin.ModelAdmin):
         "lands_count",
     )
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(lands_count=Count("lands"))
+
     def lands_count(self, obj):
-        return obj.lands.count()
+        return obj.lands_count
 
     lands_count.short_description = "Lands Count"
+    lands_count.admin_order_field = "lands_count"
 
     def preserved_rate(self, obj):
         if obj.preserved_area:
@@ -32,6 +37,7 @@ class BiomeAdmin(admin.ModelAdmin):
 class LandAdmin(admin.ModelAdmin):
     list_display = ("name", "total_area", "biome", "category", "isa_link")
     list_filter = ("biome", "category")
+    list_select_related = ("biome",)
 
     def isa_link(self, obj):
         if not obj.isa_id:
@@ -0,0 +1,77 @@
+import factory
+from factory.django import DjangoModelFactory
+
+from .models import Biome, Country, Land, State
+
+
+class BulkDjangoModelFactory(DjangoModelFactory):
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def create_batch(cls, size, **kwargs):
+        # SubFactories follow the build strategy, so create each related object
+        # once up front (with the SubFactory's own defaults and any
+        # "name__field" overrides) and share it across the batch before the
+        # single INSERT. Passing both "name" and "name__field" is rejected.
+        # bulk_create bypasses _create: post_generation hooks and
+        # django_get_or_create are not applied, and the returned objects only
+        # have primary keys on backends that can return rows from bulk inserts.
+        for name, declaration in cls._meta.declarations.items():
+            if not isinstance(declaration, factory.SubFactory):
+                continue
+            prefix = name + "__"
+            sub_kwargs = {
+                key[len(prefix) :]: kwargs.pop(key)
+                for key in list(kwargs)
+                if key.startswith(prefix)
+            }
+            if name in kwargs:
+                if sub_kwargs:
+                    raise ValueError(
+                        "Cannot pass both %r and %r overrides" % (name, prefix)
+                    )
+                continue
+            kwargs[name] = declaration.get_factory().create(
+                **{**declaration.defaults, **sub_kwargs}
+            )
+        objs = cls.build_batch(size, **kwargs)
+        return cls._meta.model.objects.bulk_create(objs)
+
+
+class CountryFactory(BulkDjangoModelFactory):
+    name = factory.Faker("country")
+    name_local = factory.SelfAttribute("name")
+    code = factory.Faker("country_code")
+    language = "Portuguese"
+
+    class Meta:
+        model = Country
+
+
+class StateFactory(BulkDjangoModelFactory):
+    name = factory.Faker("state")
+    code = factory.Faker("state_abbr")
+    country = factory.SubFactory(CountryFactory)
+
+    class Meta:
+        model = State
+
+
+class BiomeFactory(BulkDjangoModelFactory):
+    name = factory.Sequence(lambda n: "Biome %d" % n)
+    name_local = factory.SelfAttribute("name")
+    country = factory.SubFactory(CountryFactory)
+
+    class Meta:
+        model = Biome
+
+
+class LandFactory(BulkDjangoModelFactory):
+    name = factory.Sequence(lambda n: "Land %d" % n)
+    state = factory.SubFactory(StateFactory)
+    biome = factory.SubFactory(BiomeFactory)
+    category = factory.Iterator([code for code, _ in Land.CATEGORY_CHOICES])
+
+    class Meta:
+        model = Land
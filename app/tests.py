@@ -1,14 +1,106 @@
-from django.test import Client, TestCase
+from unittest import skipUnless
 
+import factory
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
 
-class SimpleTest(TestCase):
-    def setUp(self):
-        # Every test needs a client.
-        self.client = Client()
+from .factories import BiomeFactory, CountryFactory, LandFactory, StateFactory
+from .models import Country, Land, State
 
+
+class SimpleTest(TestCase):
     def test_details(self):
         # Issue a GET request.
         response = self.client.get("/")
 
         # Check that the response is 200 OK.
         self.assertEqual(response.status_code, 200)
+
+
+class BulkFactoryTest(TestCase):
+    def test_create_batch_issues_single_insert(self):
+        with self.assertNumQueries(1):
+            countries = CountryFactory.create_batch(10)
+
+        self.assertEqual(len(countries), 10)
+        self.assertEqual(Country.objects.count(), 10)
+
+    @skipUnless(
+        connection.features.can_return_rows_from_bulk_insert,
+        "bulk_create only sets primary keys on backends that return inserted rows",
+    )
+    def test_create_batch_sets_primary_keys(self):
+        countries = CountryFactory.create_batch(3)
+
+        self.assertTrue(all(country.pk for country in countries))
+
+    def test_create_batch_shares_related_objects(self):
+        lands = LandFactory.create_batch(5)
+
+        self.assertEqual(Land.objects.count(), 5)
+        self.assertEqual(len({land.state_id for land in lands}), 1)
+        self.assertEqual(len({land.biome_id for land in lands}), 1)
+
+    def test_create_batch_applies_subfactory_overrides(self):
+        lands = LandFactory.create_batch(2, state__country__name="Brazil")
+
+        self.assertEqual(State.objects.get().country.name, "Brazil")
+        self.assertTrue(all(land.state.country.name == "Brazil" for land in lands))
+
+    def test_create_batch_applies_subfactory_defaults(self):
+        class BrazilianStateFactory(StateFactory):
+            country = factory.SubFactory(CountryFactory, name="Brazil")
+
+        states = BrazilianStateFactory.create_batch(2)
+
+        self.assertEqual(Country.objects.get().name, "Brazil")
+        self.assertTrue(all(state.country.name == "Brazil" for state in states))
+
+    def test_create_batch_rejects_instance_with_subfactory_overrides(self):
+        country = CountryFactory()
+
+        with self.assertRaises(ValueError):
+            StateFactory.create_batch(2, country=country, country__name="Brazil")
+
+
+class AdminChangelistQueriesTest(TestCase):
+    def setUp(self):
+        user = User.objects.create_superuser("admin", "admin@example.com", "admin")
+        self.client.force_login(user)
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def test_biome_changelist_queries_do_not_grow_with_rows(self):
+        url = reverse("admin:app_biome_changelist")
+        LandFactory.create_batch(2)
+        baseline = self.count_queries(url)
+
+        for _ in range(3):
+            LandFactory.create_batch(2)
+        BiomeFactory()
+
+        with self.assertNumQueries(baseline):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+    def test_land_changelist_queries_do_not_grow_with_rows(self):
+        url = reverse("admin:app_land_changelist")
+        LandFactory()
+        LandFactory(biome=None)
+        baseline = self.count_queries(url)
+
+        for _ in range(3):
+            LandFactory()
+            LandFactory(biome=None)
+
+        with self.assertNumQueries(baseline):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)